@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import importlib.util
+import queue
+import threading
 import tkinter as tk
 from pathlib import Path
 from tkinter import filedialog, messagebox, ttk
@@ -29,6 +31,9 @@ class SamplePackMakerApp:
         self.root.minsize(640, 460)
 
         self.wav_files: list[Path] = []
+        self._wav_set: set[Path] = set()
+        self._progress_queue: queue.Queue[tuple[int, int]] = queue.Queue()
+        self._export_running = False
 
         self._build_layout()
         self._configure_drag_and_drop()
@@ -108,6 +113,12 @@ class SamplePackMakerApp:
         self.status_label = ttk.Label(status_frame, textvariable=self.status_var, anchor="w")
         self.status_label.grid(row=0, column=0, sticky="ew")
 
+        self.progress_var = tk.DoubleVar(value=0.0)
+        self.progress_bar = ttk.Progressbar(
+            status_frame, variable=self.progress_var, maximum=100.0, length=160
+        )
+        self.progress_bar.grid(row=0, column=1, sticky="e", padx=(8, 0))
+
     def _configure_drag_and_drop(self) -> None:
         if not self.dnd_enabled:
             self.drop_area.state(["disabled"])
@@ -134,30 +145,29 @@ class SamplePackMakerApp:
             self.update_status("No WAV files detected in selection.")
             return
 
-        existing = {path.resolve() for path in self.wav_files}
+        # filter_wav_files already returns resolved paths, so membership checks
+        # are plain set lookups against the persistent dedupe set. Newly added
+        # paths are appended to the listbox in place rather than rebuilding it.
         added = 0
         for path in new_paths:
-            if path.resolve() in existing:
+            if path in self._wav_set:
                 continue
             self.wav_files.append(path)
-            existing.add(path.resolve())
+            self._wav_set.add(path)
+            self.file_listbox.insert(tk.END, path.name)
             added += 1
 
+        assert self.file_listbox.size() == len(self.wav_files)
+
         if added:
             self.update_status(f"Added {added} file(s).")
         else:
             self.update_status("Files already in list.")
 
-        self._refresh_listbox()
-
-    def _refresh_listbox(self) -> None:
-        self.file_listbox.delete(0, tk.END)
-        for path in self.wav_files:
-            self.file_listbox.insert(tk.END, path.name)
-
     def clear_list(self) -> None:
         self.wav_files.clear()
-        self._refresh_listbox()
+        self._wav_set.clear()
+        self.file_listbox.delete(0, tk.END)
         self.update_status("Cleared file list.")
 
     def process_files(self) -> None:
@@ -171,16 +181,45 @@ class SamplePackMakerApp:
 
         self._set_controls_state("disabled")
         self.update_status("Processing…")
-        self.root.update_idletasks()
+        self.progress_var.set(0.0)
+        self._export_running = True
+
+        # Run the export on a worker thread so the mainloop keeps pumping
+        # events; results and progress come back via root.after.
+        threading.Thread(
+            target=self._run_export, args=(pack_name, list(self.wav_files)), daemon=True
+        ).start()
+        self.root.after(50, self._drain_progress)
 
+    def _run_export(self, pack_name: str, wav_files: list[Path]) -> None:
         try:
-            output_folder, count = process_wav_files(self.wav_files, pack_name)
+            output_folder, count = process_wav_files(
+                wav_files, pack_name, progress_callback=self._report_progress
+            )
         except Exception as exc:  # noqa: BLE001
-            messagebox.showerror("Processing Error", str(exc))
-            self.update_status("Error during processing.")
-            self._set_controls_state("!disabled")
+            self.root.after(0, self._on_export_error, exc)
             return
 
+        self.root.after(0, self._on_export_done, output_folder, count)
+
+    def _report_progress(self, done: int, total: int) -> None:
+        self._progress_queue.put((done, total))
+
+    def _drain_progress(self) -> None:
+        try:
+            while True:
+                done, total = self._progress_queue.get_nowait()
+                self.progress_var.set(done * 100.0 / total)
+                self.update_status(f"Processing… {done}/{total}")
+        except queue.Empty:
+            pass
+
+        if self._export_running:
+            self.root.after(50, self._drain_progress)
+
+    def _on_export_done(self, output_folder: Path, count: int) -> None:
+        self._export_running = False
+        self.progress_var.set(100.0)
         messagebox.showinfo(
             "Export Complete",
             f"Processed {count} file(s).\nOutput folder:\n{output_folder}",
@@ -188,6 +227,13 @@ class SamplePackMakerApp:
         self.update_status(f"Done. Exported to {output_folder}")
         self._set_controls_state("!disabled")
 
+    def _on_export_error(self, exc: Exception) -> None:
+        self._export_running = False
+        self.progress_var.set(0.0)
+        messagebox.showerror("Processing Error", str(exc))
+        self.update_status("Error during processing.")
+        self._set_controls_state("!disabled")
+
     def update_status(self, text: str) -> None:
         self.status_var.set(text)
 